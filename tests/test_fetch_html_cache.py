@@ -0,0 +1,60 @@
+import hashlib
+
+import uofm_calendar_import as uofm
+
+
+URL = "https://preview.memphis.edu/registrar/calendars/academic/ay2526.php"
+KEY = hashlib.sha1(URL.encode("utf-8")).hexdigest()
+
+
+class FakeResponse:
+    def __init__(self, status_code, text="", etag=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = {"ETag": etag} if etag else {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+
+class FakeSession:
+    def __init__(self, response):
+        self.response = response
+        self.sent_headers = []
+
+    def get(self, url, timeout, headers):
+        self.sent_headers.append(dict(headers))
+        return self.response
+
+
+def test_revalidates_and_serves_cached_body_on_304(tmp_path, monkeypatch):
+    monkeypatch.setattr(uofm, "CACHE_DIR", tmp_path)
+    (tmp_path / f"{KEY}.html").write_text("cached page", encoding="utf-8")
+    (tmp_path / f"{KEY}.etag").write_text('"abc"', encoding="utf-8")
+    session = FakeSession(FakeResponse(304))
+    monkeypatch.setattr(uofm, "_SESSION", session)
+
+    assert uofm.fetch_html(URL) == "cached page"
+    assert session.sent_headers == [{"If-None-Match": '"abc"'}]
+
+
+def test_corrupt_cache_falls_back_to_unconditional_get(tmp_path, monkeypatch):
+    monkeypatch.setattr(uofm, "CACHE_DIR", tmp_path)
+    (tmp_path / f"{KEY}.html").write_bytes(b"\xff\xfe\xfa")
+    (tmp_path / f"{KEY}.etag").write_text('"abc"', encoding="utf-8")
+    session = FakeSession(FakeResponse(200, "fresh page", etag='"def"'))
+    monkeypatch.setattr(uofm, "_SESSION", session)
+
+    assert uofm.fetch_html(URL) == "fresh page"
+    assert session.sent_headers == [{}]
+    assert (tmp_path / f"{KEY}.etag").read_text(encoding="utf-8") == '"def"'
+
+
+def test_unwritable_cache_still_returns_page(tmp_path, monkeypatch):
+    not_a_dir = tmp_path / "cache"
+    not_a_dir.write_text("", encoding="utf-8")
+    monkeypatch.setattr(uofm, "CACHE_DIR", not_a_dir)
+    monkeypatch.setattr(uofm, "_SESSION", FakeSession(FakeResponse(200, "fresh page", etag='"def"')))
+
+    assert uofm.fetch_html(URL) == "fresh page"
@@ -0,0 +1,42 @@
+import uofm_calendar_import as uofm
+
+
+ACADEMIC_PAGE = """<html>
+<head>
+<title>Academic Calendar</title>
+<style>.term { color: red; }</style>
+<script>var upcoming = "Spring 2026";</script>
+</head>
+<body>
+<h2>Full Part of Term</h2>
+<ul>
+<li>First Day of Classes: August 25, 2025 / Monday</li>
+<li>Last Day of Classes: December 4, 2025 / Thursday</li>
+</ul>
+<h2>Spring 2026</h2>
+<h3>Full Part of Term</h3>
+<ul>
+<li>First Day of Classes: January 20, 2026 / Tuesday</li>
+<li>Last Day of Classes: May 5, 2026 / Tuesday</li>
+</ul>
+<h2>Summer 2026</h2>
+</body>
+</html>"""
+
+
+def test_html_to_text_drops_script_and_style():
+    text = uofm.html_to_text(ACADEMIC_PAGE)
+    assert "var upcoming" not in text
+    assert "color: red" not in text
+    assert "First Day of Classes: August 25, 2025 / Monday" in text
+
+
+def test_inline_script_does_not_move_term_boundaries():
+    fall = uofm.extract_term_block_text(ACADEMIC_PAGE, 2025, "fall")
+    assert "First Day of Classes: August 25, 2025 / Monday" in fall
+    assert "January 20, 2026" not in fall
+
+    spring = uofm.extract_term_block_text(ACADEMIC_PAGE, 2026, "spring")
+    assert spring.startswith("Spring 2026")
+    assert "First Day of Classes: January 20, 2026 / Tuesday" in spring
+    assert "August 25, 2025" not in spring
@@ -40,13 +40,19 @@ from __future__ import annotations
 
 import argparse
 import dataclasses
+import functools
+import hashlib
+import itertools
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
+from pathlib import Path
 from typing import Iterable, List, Optional, Tuple, Dict
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
 from dateutil import parser as dateparser
 
 from google.oauth2.credentials import Credentials
@@ -61,12 +67,60 @@ TARGET_CALENDAR_ID = "61147m13qjm5liln3f318l3a08@group.calendar.google.com"
 ACADEMIC_BASE = "https://preview.memphis.edu/registrar/calendars/academic"
 DATES_BASE = "https://preview.memphis.edu/registrar/calendars/dates"
 
+# Fetched pages are kept here with their ETag so re-runs can revalidate instead of re-downloading
+CACHE_DIR = Path(".uofm_cache")
+
+# Common subheaders used on the academic-year pages (extend if needed)
+_SUBSECTION_HEADERS = frozenset({
+    "All Parts of Term",
+    "Winter Intersession",
+    "Full Part of Term",
+    "1st Half Part of Term",
+    "2nd Half Part of Term",
+    "Pre Summer Part of Term",
+    "Extended Summer Part of Term",
+})
+
+MDY_FORMAT = "%B %d, %Y"
+
+# Bullet labels read from the academic-year term block (extend if needed)
+BULLET_LABELS = (
+    "First Day of Classes",
+    "Last Day of Classes",
+    "Study Day",
+    "Exams",
+    "Spring Break",
+    "Fall Break",
+    "Thanksgiving Holidays",
+    "Labor Day",
+    "M. L. King, Jr. Holiday",
+)
+
+# Patterns used on every scrape; compiled once at import.
+_MDY_RE = re.compile(r"[A-Za-z]+\s+\d{1,2},\s*\d{4}")
+_RANGE_RE = re.compile(r"^([A-Za-z]+)\s+(\d{1,2})\s*-\s*(\d{1,2}),\s*(\d{4})$")
+_RANGE_TRAIL_RE = re.compile(r"^([A-Za-z]+)\s+(\d{1,2})\s*-\s*(\d{1,2}),\s*(\d{4}).*$")
+_TERM_HDR_RE = re.compile(r"\b(Summer|Fall|Spring)\s+\d{4}\b")
+_SPRING_HDR_RE = re.compile(r"\bSpring\s+\d{4}\b")
+# "Label: <Month> <day>, <year>" or "Label: <Month> <d>-<d>, <year>"
+_BULLET_ALL_RE = re.compile(
+    r"(?P<label>" + "|".join(map(re.escape, BULLET_LABELS)) + r")\s*:\s*"
+    r"(?P<value>[A-Za-z]+\s+\d{1,2}(?:(?P<range_end>\s*[-–]\s*\d{1,2}),\s*|,\s+)\d{4})"
+)
+_BULLET_RE = re.compile(r"^[\s\-\*\u2022\u00B7]+")
+_DROP_PERIOD_RE = re.compile(r"Drop Period", re.IGNORECASE)
+_WITHDRAWAL_PERIOD_RE = re.compile(r"Withdrawal Period", re.IGNORECASE)
+_FULL_RE = re.compile(r"^\s*FULL\b")
+_FULL_SEP_RE = re.compile(r"^[\s\-–:]+")
+_FULL_TWO_MON_RE = re.compile(r"([A-Za-z]+)\s+(\d{1,2})\s*-\s*([A-Za-z]+)\s+(\d{1,2}),\s*(\d{4})")
+_FULL_SAME_MON_RE = re.compile(r"([A-Za-z]+)\s+(\d{1,2})\s*-\s*(\d{1,2}),\s*(\d{4})")
+
 
 # -----------------------------
 # Utilities: dates & ranges
 # -----------------------------
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class DateRange:
     start: date
     end: date  # inclusive
@@ -81,45 +135,109 @@ class DateRange:
         return DateRange(start=max(self.start, lo), end=min(self.end, hi))
 
 
-def daterange_inclusive(start: date, end: date) -> Iterable[date]:
-    cur = start
-    while cur <= end:
-        yield cur
-        cur += timedelta(days=1)
-
-
-def to_google_allday(start_d: date, end_inclusive: date) -> Dict[str, Dict[str, str]]:
+def merge_ranges(ranges: Iterable[DateRange]) -> List[DateRange]:
     """
-    Google all-day events use an *exclusive* end date.
+    Sorts ranges and folds overlapping or back-to-back ones together.
     """
-    return {
-        "start": {"date": start_d.isoformat()},
-        "end": {"date": (end_inclusive + timedelta(days=1)).isoformat()},
-    }
+    merged: List[DateRange] = []
+    for r in sorted(ranges, key=lambda r: r.start):
+        if merged and r.start <= merged[-1].end + timedelta(days=1):
+            merged[-1] = DateRange(merged[-1].start, max(merged[-1].end, r.end))
+        else:
+            merged.append(r)
+    return merged
 
 
 # -----------------------------
 # Scraping helpers
 # -----------------------------
 
+def _make_session() -> requests.Session:
+    """
+    All pages live on the same host, so one keep-alive session saves a TLS handshake per fetch.
+    """
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    session.headers.update({"Accept-Encoding": "gzip"})
+    return session
+
+
+_SESSION = _make_session()
+
+
 def fetch_html(url: str, timeout: int = 30) -> str:
-    r = requests.get(url, timeout=timeout)
+    """
+    GETs a page. If an earlier run cached it with an ETag, sends If-None-Match and
+    serves the cached copy on 304 Not Modified.
+    The cache is best-effort: unreadable or unwritable cache files never fail the fetch.
+    """
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    body_path = CACHE_DIR / f"{key}.html"
+    etag_path = CACHE_DIR / f"{key}.etag"
+
+    headers = {}
+    cached_body = None
+    try:
+        if body_path.exists() and etag_path.exists():
+            etag = etag_path.read_text(encoding="utf-8").strip()
+            cached_body = body_path.read_text(encoding="utf-8")
+            if etag:
+                headers["If-None-Match"] = etag
+    except (OSError, UnicodeDecodeError):
+        headers = {}  # fall back to an unconditional GET
+
+    r = _SESSION.get(url, timeout=timeout, headers=headers)
+    if r.status_code == 304 and headers:
+        return cached_body
     r.raise_for_status()
+
+    etag = r.headers.get("ETag")
+    if etag:
+        try:
+            CACHE_DIR.mkdir(exist_ok=True)
+            etag_path.unlink(missing_ok=True)  # never pair an ETag with a half-written body
+            body_path.write_text(r.text, encoding="utf-8")
+            etag_path.write_text(etag, encoding="utf-8")
+        except OSError:
+            pass
     return r.text
 
 
+def html_to_text(html: str) -> str:
+    """
+    Dumps the text of a page, one text node per line.
+    Script/style/template contents are not page text and are dropped first.
+    """
+    tree = LexborHTMLParser(html)
+    tree.strip_tags(["script", "style", "template"])
+    return tree.root.text(separator="\n")
+
+
 def normalize_whitespace(s: str) -> str:
-    return re.sub(r"\s+", " ", s).strip()
+    return " ".join(s.split())
 
 
+@functools.lru_cache(maxsize=256)
 def parse_month_day_year(text: str) -> date:
     """
     Parses strings like:
       "August 25, 2025"
       "January 20, 2026"
+    Falls back to dateutil for anything strptime rejects (e.g., abbreviated months).
     """
-    dt = dateparser.parse(text, fuzzy=True).date()
-    return dt
+    try:
+        return datetime.strptime(text.strip(), MDY_FORMAT).date()
+    except ValueError:
+        return dateparser.parse(text, fuzzy=True).date()
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_mdy(mon: str, day: int, year: int) -> date:
+    text = f"{mon} {day}, {year}"
+    try:
+        return datetime.strptime(text, MDY_FORMAT).date()
+    except ValueError:
+        return dateparser.parse(text).date()
 
 
 def parse_range(text: str) -> DateRange:
@@ -137,19 +255,19 @@ def parse_range(text: str) -> DateRange:
     t = text.replace("–", "-")
     t = normalize_whitespace(t)
     # Example: "October 11-14, 2025"
-    m = re.match(r"^([A-Za-z]+)\s+(\d{1,2})\s*-\s*(\d{1,2}),\s*(\d{4})$", t)
+    m = _RANGE_RE.match(t)
     if m:
         mon, d1, d2, yyyy = m.group(1), int(m.group(2)), int(m.group(3)), int(m.group(4))
-        start = dateparser.parse(f"{mon} {d1}, {yyyy}").date()
-        end = dateparser.parse(f"{mon} {d2}, {yyyy}").date()
+        start = _parse_mdy(mon, d1, yyyy)
+        end = _parse_mdy(mon, d2, yyyy)
         return DateRange(start=start, end=end)
 
     # Example: "December 5-11, 2025 / Friday-Thursday" (strip trailing after year)
-    m = re.match(r"^([A-Za-z]+)\s+(\d{1,2})\s*-\s*(\d{1,2}),\s*(\d{4}).*$", t)
+    m = _RANGE_TRAIL_RE.match(t)
     if m:
         mon, d1, d2, yyyy = m.group(1), int(m.group(2)), int(m.group(3)), int(m.group(4))
-        start = dateparser.parse(f"{mon} {d1}, {yyyy}").date()
-        end = dateparser.parse(f"{mon} {d2}, {yyyy}").date()
+        start = _parse_mdy(mon, d1, yyyy)
+        end = _parse_mdy(mon, d2, yyyy)
         return DateRange(start=start, end=end)
 
     # If it's a single date, treat as a 1-day range.
@@ -208,10 +326,8 @@ def extract_term_block_text(academic_html: str, year: int, semester: str) -> str
       - For spring: find heading containing "Spring {year}" and take text until next heading (##)
       - For fall: take from start until "## Spring {year+1}" (or until "## Spring")
     """
-    soup = BeautifulSoup(academic_html, "html.parser")
-    full_text = soup.get_text("\n")
-    lines = [normalize_whitespace(line) for line in full_text.splitlines()]
-    lines = [line for line in lines if line]
+    full_text = html_to_text(academic_html)
+    lines = [line for line in map(normalize_whitespace, full_text.splitlines()) if line]
 
     semester = semester.lower()
     if semester == "spring":
@@ -220,53 +336,57 @@ def extract_term_block_text(academic_html: str, year: int, semester: str) -> str
         if start_idx is None:
             raise RuntimeError(f"Could not find '{key}' section on academic-year page.")
         # take until next major heading marker "Summer" or another term header
-        end_idx = next((i for i in range(start_idx + 1, len(lines)) if re.search(r"\b(Summer|Fall|Spring)\s+\d{4}\b", lines[i]) and key not in lines[i]), len(lines))
+        end_idx = len(lines)
+        for i, l in enumerate(lines[start_idx + 1:], start_idx + 1):
+            if key not in l and _TERM_HDR_RE.search(l):
+                end_idx = i
+                break
         return "\n".join(lines[start_idx:end_idx])
 
     # fall
-    # Use the next spring heading as a boundary (spring is in next calendar year)
+    # Use the next spring heading as a boundary (spring is in next calendar year);
+    # fallback: first occurrence of any "Spring ####". Both are found in one scan.
     key_next_spring = f"Spring {year + 1}"
-    boundary = next((i for i, l in enumerate(lines) if key_next_spring in l), None)
-    if boundary is None:
-        # fallback: first occurrence of any "Spring ####"
-        boundary = next((i for i, l in enumerate(lines) if re.search(r"\bSpring\s+\d{4}\b", l)), None)
+    boundary = None
+    first_spring = None
+    for i, l in enumerate(lines):
+        if key_next_spring in l:
+            boundary = i
+            break
+        if first_spring is None and _SPRING_HDR_RE.search(l):
+            first_spring = i
     if boundary is None:
-        boundary = len(lines)
+        boundary = first_spring if first_spring is not None else len(lines)
     return "\n".join(lines[:boundary])
 
 
-def find_bullet_date(term_text: str, label: str) -> Optional[date]:
+def scan_bullets(term_text: str) -> Dict[Tuple[str, bool], str]:
     """
-    Finds a line like:
+    Single pass over the term text collecting every BULLET_LABELS line like:
       "* First Day of Classes: August 25, 2025 / Monday"
-    Returns the date.
+      "* Exams: December 5-11, 2025 / Friday-Thursday"
+    Returns {(label, is_range): raw date text}; the first occurrence of each key wins.
     """
-    # Match "Label: <Month> <day>, <year>"
-    pat = re.compile(rf"{re.escape(label)}\s*:\s*([A-Za-z]+\s+\d{{1,2}},\s+\d{{4}})")
-    m = pat.search(term_text)
-    if not m:
-        return None
-    return parse_month_day_year(m.group(1))
+    bullets: Dict[Tuple[str, bool], str] = {}
+    for m in _BULLET_ALL_RE.finditer(term_text):
+        bullets.setdefault((m.group("label"), m.group("range_end") is not None), m.group("value"))
+    return bullets
 
 
-def find_bullet_range(term_text: str, label: str) -> Optional[DateRange]:
-    """
-    Finds a line like:
-      "* Exams: December 5-11, 2025 / Friday-Thursday"
-    Returns DateRange.
-    """
-    # Match "Label: <Month> <d>-<d>, <year>"
-    pat = re.compile(rf"{re.escape(label)}\s*:\s*([A-Za-z]+\s+\d{{1,2}}\s*[-–]\s*\d{{1,2}},\s*\d{{4}})")
-    m = pat.search(term_text)
-    if not m:
-        return None
-    return parse_range(m.group(1))
+def bullet_date(bullets: Dict[Tuple[str, bool], str], label: str) -> Optional[date]:
+    raw = bullets.get((label, False))
+    return parse_month_day_year(raw) if raw else None
 
 
-def find_any_labeled_ranges(term_text: str, labels: List[str]) -> List[Tuple[str, DateRange]]:
+def bullet_range(bullets: Dict[Tuple[str, bool], str], label: str) -> Optional[DateRange]:
+    raw = bullets.get((label, True))
+    return parse_range(raw) if raw else None
+
+
+def find_any_labeled_ranges(bullets: Dict[Tuple[str, bool], str], labels: List[str]) -> List[Tuple[str, DateRange]]:
     found = []
     for lab in labels:
-        rng = find_bullet_range(term_text, lab)
+        rng = bullet_range(bullets, lab)
         if rng:
             found.append((lab, rng))
     return found
@@ -282,20 +402,14 @@ def parse_deadlines_drop_withdraw(dates_html: str) -> Tuple[Optional[date], Opti
       (last_day_drop_no_grade, last_day_withdraw_W)
     """
     print("Starting Parsing Deadlines")
-    soup = BeautifulSoup(dates_html, "html.parser")
-    # print(f"Soup: {soup}")
-
-    txt = soup.get_text("\n")
+    txt = html_to_text(dates_html)
     #print(f"txt: {txt}")
 
-    raw_lines = [normalize_whitespace(l) for l in txt.splitlines()]
-    raw_lines = [l for l in raw_lines if l]
-
     def strip_bullets(s: str) -> str:
         # Remove common bullet/list prefixes while preserving content
-        return re.sub(r"^[\s\-\*\u2022\u00B7]+", "", s).strip()
+        return _BULLET_RE.sub("", s).strip()
 
-    lines = [strip_bullets(l) for l in raw_lines]
+    lines = [strip_bullets(l) for l in map(normalize_whitespace, txt.splitlines()) if l]
 
     # Identify sections by scanning text
     in_drop = False
@@ -306,34 +420,36 @@ def parse_deadlines_drop_withdraw(dates_html: str) -> Tuple[Optional[date], Opti
     full_withdraw_line_next = False
 
     for l in lines:
+        # Stop as soon as the second FULL line is captured
         if full_drop_line_next:
             full_drop_line = l
             full_drop_line_next = False
+            if full_withdraw_line is not None:
+                break
             continue
         if full_withdraw_line_next:
             full_withdraw_line = l
             full_withdraw_line_next = False
+            if full_drop_line is not None:
+                break
             continue
         # Section toggles (these strings appear on the page)
-        if re.search(r"Drop Period", l, re.IGNORECASE):
+        if _DROP_PERIOD_RE.search(l):
             in_drop = True
             in_withdraw = False
             continue
-        if re.search(r"Withdrawal Period", l, re.IGNORECASE):
+        if _WITHDRAWAL_PERIOD_RE.search(l):
             in_drop = False
             in_withdraw = True
             continue
         # Grab the first FULL line in each section (ignore WIN, 1ST, 2ND, TN eCampus, etc.)
-        if in_drop and full_drop_line is None and re.match(r"^\s*FULL\b", l):
+        if in_drop and full_drop_line is None and _FULL_RE.match(l):
             full_drop_line_next = True 
             continue
-        if in_withdraw and full_withdraw_line is None and re.match(r"^\s*FULL\b", l):
+        if in_withdraw and full_withdraw_line is None and _FULL_RE.match(l):
             full_withdraw_line_next = True
             continue
 
-        if full_drop_line and full_withdraw_line:
-            break
-
     def extract_end_date_from_full_line(line: Optional[str]) -> Optional[date]:
         if not line:
             return None
@@ -342,29 +458,29 @@ def parse_deadlines_drop_withdraw(dates_html: str) -> Tuple[Optional[date], Opti
         # Examples:
         #   "FULL  -  January 20 - February 2, 2026"
         #   "FULL  -  February 3 - April 11, 2026"
-        rest = re.sub(r"^\s*FULL\b", "", line).strip()
-        rest = re.sub(r"^[\s\-–:]+", "", rest).strip()
+        rest = _FULL_RE.sub("", line).strip()
+        rest = _FULL_SEP_RE.sub("", rest).strip()
         rest = rest.replace("–", "-")
         rest = normalize_whitespace(rest)
 
         # Case A: single date "Month d, yyyy"
-        if re.fullmatch(r"[A-Za-z]+\s+\d{1,2},\s*\d{4}", rest):
+        if _MDY_RE.fullmatch(rest):
             return parse_month_day_year(rest)
 
         # Case B: range with two months "January 20 - February 2, 2026"
-        m = re.fullmatch(r"([A-Za-z]+)\s+(\d{1,2})\s*-\s*([A-Za-z]+)\s+(\d{1,2}),\s*(\d{4})", rest)
+        m = _FULL_TWO_MON_RE.fullmatch(rest)
         if m:
             end_mon, end_day, end_year = m.group(3), int(m.group(4)), int(m.group(5))
-            return dateparser.parse(f"{end_mon} {end_day}, {end_year}").date()
+            return _parse_mdy(end_mon, end_day, end_year)
 
         # Case C: range same month "March 16-29, 2026" or "March 16 - 29, 2026"
-        m = re.fullmatch(r"([A-Za-z]+)\s+(\d{1,2})\s*-\s*(\d{1,2}),\s*(\d{4})", rest)
+        m = _FULL_SAME_MON_RE.fullmatch(rest)
         if m:
             mon, end_day, end_year = m.group(1), int(m.group(3)), int(m.group(4))
-            return dateparser.parse(f"{mon} {end_day}, {end_year}").date()
+            return _parse_mdy(mon, end_day, end_year)
 
         # Fallback: pick the last explicit "Month d, yyyy" if present
-        candidates = re.findall(r"[A-Za-z]+\s+\d{1,2},\s*\d{4}", rest)
+        candidates = _MDY_RE.findall(rest)
         if candidates:
             return parse_month_day_year(candidates[-1])
 
@@ -397,61 +513,104 @@ def get_calendar_service(credentials_path: str = "credentials.json", token_path:
     return build("calendar", "v3", credentials=creds)
 
 
-def upsert_event(service, calendar_id: str, summary: str, start_d: date, end_inclusive: date, description: str = ""):
+def _rfc3339_midnight(d: date) -> str:
+    return datetime.combine(d, datetime.min.time()).isoformat() + "Z"
+
+
+# (summary, all-day start date, all-day exclusive end date)
+EventKey = Tuple[Optional[str], Optional[str], Optional[str]]
+
+
+def prefetch_existing(service, calendar_id: str, time_min: str, time_max: str) -> Dict[EventKey, dict]:
+    """
+    Lists every event between time_min and time_max once (following pagination) and
+    indexes it by (summary, all-day start date, all-day exclusive end date).
     """
-    Insert the event only if it does not already exist.
+    existing: Dict[EventKey, dict] = {}
+    page_token = None
+    while True:
+        resp = service.events().list(
+            calendarId=calendar_id,
+            timeMin=time_min,
+            timeMax=time_max,
+            singleEvents=True,
+            maxResults=2500,
+            pageToken=page_token,
+            # Only the dedupe key is read back; skip the rest of each event payload
+            fields="items(summary,start/date,end/date),nextPageToken",
+        ).execute()
+        for e in resp.get("items", []):
+            key = (e.get("summary"), (e.get("start") or {}).get("date"), (e.get("end") or {}).get("date"))
+            existing.setdefault(key, e)
+        page_token = resp.get("nextPageToken")
+        if not page_token:
+            break
+    return existing
+
+
+GOOGLE_BATCH_LIMIT = 50  # max sub-requests per BatchHttpRequest
 
-    Existence test:
-      - Any event in the nearby window with the same summary
+
+def upsert_events(service, calendar_id: str, existing: Dict[EventKey, dict], events: List[Tuple[str, date, date, str]]):
+    """
+    Insert each (summary, start, end_inclusive, description) event only if it does not already exist.
+
+    Existence test (against the index built by prefetch_existing):
+      - Any event with the same summary
       - AND same all-day start date
       - AND same all-day end date (Google stores all-day end as exclusive)
 
     If found: do nothing (skip).
-    If not found: insert.
+    If not found: insert. Inserts are sent as batch requests of up to 50 events each.
 
     Note:
     - This avoids duplicates on re-runs.
     - It also means if you change details later (description, etc.), this will not update old events.
-      If you want update behavior, see the optional "update-if-exists" section below.
     """
-    # Google all-day end is exclusive
-    desired_start = start_d.isoformat()
-    desired_end_excl = (end_inclusive + timedelta(days=1)).isoformat()
-
-    # Search in a small window around the event
-    time_min = datetime.combine(start_d - timedelta(days=2), datetime.min.time()).isoformat() + "Z"
-    time_max = datetime.combine(end_inclusive + timedelta(days=3), datetime.min.time()).isoformat() + "Z"
-
-    events = service.events().list(
-        calendarId=calendar_id,
-        timeMin=time_min,
-        timeMax=time_max,
-        singleEvents=True,
-        maxResults=250,
-    ).execute().get("items", [])
-
-    # If an event already exists with same summary + same all-day dates, skip creating.
-    for e in events:
-        if e.get("summary") != summary:
+    pending: List[Tuple[EventKey, str, date, date, dict]] = []
+    for summary, start_d, end_inclusive, description in events:
+        # Google all-day end is exclusive
+        desired_start = start_d.isoformat()
+        desired_end_excl = (end_inclusive + timedelta(days=1)).isoformat()
+
+        # If an event already exists with same summary + same all-day dates, skip creating.
+        key = (summary, desired_start, desired_end_excl)
+        if key in existing:
+            print(f"Exists:  {summary} ({start_d}..{end_inclusive})")
             continue
 
-        s = (e.get("start") or {}).get("date")
-        en = (e.get("end") or {}).get("date")  # exclusive for all-day events
-        if s == desired_start and en == desired_end_excl:
-            print(f"Exists:  {summary} ({start_d}..{end_inclusive})")
+        body = {
+            "summary": summary,
+            "description": description,
+            "transparency": "transparent",
+            "visibility": "default",
+            "eventType": "default",
+            "start": {"date": desired_start},
+            "end": {"date": desired_end_excl},
+        }
+        existing[key] = body  # reserve so a repeat within this run is skipped too
+        pending.append((key, summary, start_d, end_inclusive, body))
+
+    failures: List[str] = []
+
+    def on_insert(request_id: str, response, exception):
+        key, summary, start_d, end_inclusive, _ = pending[int(request_id)]
+        if exception is not None:
+            del existing[key]
+            failures.append(f"{summary} ({start_d}..{end_inclusive}): {exception}")
             return
+        existing[key] = response
+        print(f"Inserted: {summary} ({start_d}..{end_inclusive})")
 
-    body = {
-        "summary": summary,
-        "description": description,
-        "transparency": "transparent",
-        "visibility": "default",
-        "eventType": "default",
-        **to_google_allday(start_d, end_inclusive),
-    }
+    for offset in range(0, len(pending), GOOGLE_BATCH_LIMIT):
+        batch = service.new_batch_http_request(callback=on_insert)
+        for i in range(offset, min(offset + GOOGLE_BATCH_LIMIT, len(pending))):
+            body = pending[i][4]
+            batch.add(service.events().insert(calendarId=calendar_id, body=body), request_id=str(i))
+        batch.execute()
 
-    service.events().insert(calendarId=calendar_id, body=body).execute()
-    print(f"Inserted: {summary} ({start_d}..{end_inclusive})")
+    if failures:
+        raise RuntimeError("Failed to insert events:\n  " + "\n  ".join(failures))
 
 # -----------------------------
 # Week labeling logic
@@ -469,46 +628,27 @@ def instructional_week_events(
     """
     Returns list of (title, start_date, end_inclusive) for Week events.
     """
-    term_range = DateRange(first_class, last_class)
-
-    def is_blackout(day: date) -> bool:
-        return any(r.contains(day) for r in blackout_ranges)
-
-    # Iterate weeks from the week containing first_class through week containing last_class
-    wk_start = monday_of_week(first_class)
-    wk_end_boundary = monday_of_week(last_class)
-
-    week_num = 1
+    # Work in day ordinals: weekday is (ordinal - 1) % 7 with Monday == 0,
+    # and (ordinal - first Monday) // 7 is the week index.
+    blackout_ords = set()
+    for r in blackout_ranges:
+        blackout_ords.update(range(r.start.toordinal(), r.end.toordinal() + 1))
+
+    first_monday_ord = monday_of_week(first_class).toordinal()
+    instructional_ords = (
+        o
+        for o in range(first_class.toordinal(), last_class.toordinal() + 1)
+        if (o - 1) % 7 < 5 and o not in blackout_ords
+    )
+
+    # Weeks with no instructional weekdays produce no group, so they are skipped
+    # without incrementing the week counter.
     events = []
-
-    cur = wk_start
-    while cur <= wk_end_boundary:
-        mon = cur
-        fri = cur + timedelta(days=4)
-        week_range = DateRange(mon, fri).clamp(term_range.start, term_range.end)
-
-        # Collect instructional weekdays within this Mon–Fri window.
-        instructional_days = []
-        for d in daterange_inclusive(week_range.start, week_range.end):
-            if d.weekday() >= 5:  # weekend
-                continue
-            if is_blackout(d):
-                continue
-            instructional_days.append(d)
-
-        if len(instructional_days) == 0:
-            # Entire week has no instructional weekdays -> skip and do not increment week counter
-            cur += timedelta(days=7)
-            continue
-
-        start_d = instructional_days[0]
-        end_d = instructional_days[-1]
-        short = len(instructional_days) < 5
-        title = f"Week {week_num}" + (" (short)" if short else "")
-        events.append((title, start_d, end_d))
-        week_num += 1
-
-        cur += timedelta(days=7)
+    weeks = itertools.groupby(instructional_ords, key=lambda o: (o - first_monday_ord) // 7)
+    for week_num, (_, week_ords) in enumerate(weeks, start=1):
+        days = list(week_ords)
+        title = f"Week {week_num}" + (" (short)" if len(days) < 5 else "")
+        events.append((title, date.fromordinal(days[0]), date.fromordinal(days[-1])))
 
     return events
 
@@ -518,30 +658,14 @@ def extract_subsection(block_text: str, header: str) -> str:
     at a line exactly equal to `header` and continues until the next recognized subsection header.
     If the header is not found, returns the original block_text.
     """
-    lines = block_text.splitlines()
-    lines = [l.strip() for l in lines if l.strip()]
-
-    # Common subheaders used on these pages (extend if needed)
-    subsection_headers = {
-        "All Parts of Term",
-        "Winter Intersession",
-        "Full Part of Term",
-        "1st Half Part of Term",
-        "2nd Half Part of Term",
-        "Pre Summer Part of Term",
-        "Extended Summer Part of Term",
-    }
+    lines = [s for s in (l.strip() for l in block_text.splitlines()) if s]
 
     try:
         start = next(i for i, l in enumerate(lines) if l == header)
     except StopIteration:
         return block_text
 
-    end = len(lines)
-    for i in range(start + 1, len(lines)):
-        if lines[i] in subsection_headers:
-            end = i
-            break
+    end = next((i for i, l in enumerate(lines[start + 1:], start + 1) if l in _SUBSECTION_HEADERS), len(lines))
 
     return "\n".join(lines[start:end])
 
@@ -563,10 +687,11 @@ def build_term_events(year: int, semester: str, debug: bool = False) -> Dict[str
     term_text = extract_subsection(term_text, "Full Part of Term")
 
     # Extract key dates/ranges
-    first_day = find_bullet_date(term_text, "First Day of Classes")
-    last_day = find_bullet_date(term_text, "Last Day of Classes")
-    study_day = find_bullet_date(term_text, "Study Day")
-    exams_rng = find_bullet_range(term_text, "Exams")
+    bullets = scan_bullets(term_text)
+    first_day = bullet_date(bullets, "First Day of Classes")
+    last_day = bullet_date(bullets, "Last Day of Classes")
+    study_day = bullet_date(bullets, "Study Day")
+    exams_rng = bullet_range(bullets, "Exams")
 
     if not first_day or not last_day:
         raise RuntimeError("Could not determine First/Last Day of Classes from academic-year calendar.")
@@ -580,45 +705,48 @@ def build_term_events(year: int, semester: str, debug: bool = False) -> Dict[str
         "M. L. King, Jr. Holiday (All University Offices CLOSED)",
     ]
 
-    # Find common breaks as ranges
-    labeled_ranges = find_any_labeled_ranges(term_text, break_like_labels + ["Exams"])
     # Find single-day holidays (bullets with dates)
     single_holidays: List[Tuple[str, date]] = []
     for lab in ["Labor Day", "M. L. King, Jr. Holiday"]:
-        d = find_bullet_date(term_text, lab)
+        d = bullet_date(bullets, lab)
         if d:
             single_holidays.append((lab, d))
 
+    # Find common breaks as ranges.
     # Thanksgiving is usually a range on the academic calendar; keep it as blackout
-    breaks: List[Tuple[str, DateRange]] = []
-    for lab in break_like_labels:
-        rng = find_bullet_range(term_text, lab)
-        if rng:
-            breaks.append((lab, rng))
+    breaks = find_any_labeled_ranges(bullets, break_like_labels)
 
     # Add other “break/holiday-like” items that appear as ranges but not in our label list:
-    # (If you want to expand, add more labels here.)
+    # (If you want to expand, add more labels here and to BULLET_LABELS.)
     # For now, we rely on the big ones present on the academic-year page.  [oai_citation:2‡University of Memphis](https://preview.memphis.edu/registrar/calendars/academic/ay2526.php?utm_source=chatgpt.com)
 
     # 2) Dates & Deadlines page (drop/withdraw)
     dd_html = None
     dd_url_used = None
-    for u in candidate_dates_deadlines_urls(year, semester):
-        try:
-            dd_html = fetch_html(u)
-            dd_url_used = u
-            if debug:
-                with open("debug_dates_deadlines.html", "w", encoding="utf-8") as f:
-                    f.write(dd_html)
-                    print("Wrote debug_dates_deadlines.html")
-            break
-        except Exception:
-            continue
+    dd_candidates = candidate_dates_deadlines_urls(year, semester)
+    # Probe all candidates concurrently; still prefer them in listed order.
+    pool = ThreadPoolExecutor(max_workers=len(dd_candidates))
+    futures = [pool.submit(fetch_html, u) for u in dd_candidates]
+    try:
+        for u, fut in zip(dd_candidates, futures):
+            try:
+                dd_html = fut.result()
+                dd_url_used = u
+                break
+            except Exception:
+                continue
+    finally:
+        # Don't wait on slower probes once a page has been chosen
+        pool.shutdown(wait=False, cancel_futures=True)
     if not dd_html:
         raise RuntimeError(
             "Could not fetch a Dates & Deadlines page for the requested term. "
-            "Tried: " + ", ".join(candidate_dates_deadlines_urls(year, semester))
+            "Tried: " + ", ".join(dd_candidates)
         )
+    if debug:
+        with open("debug_dates_deadlines.html", "w", encoding="utf-8") as f:
+            f.write(dd_html)
+            print("Wrote debug_dates_deadlines.html")
 
     last_drop_no_grade, last_withdraw_w = parse_deadlines_drop_withdraw(dd_html)
 
@@ -639,6 +767,7 @@ def build_term_events(year: int, semester: str, debug: bool = False) -> Dict[str
     # Blackouts for week counting:
     blackout_ranges = [rng.clamp(first_day, last_day) for _, rng in breaks_in_term]
     blackout_ranges += [r for _, r in holidays_in_term]  # single-day holidays are blackout too
+    blackout_ranges = merge_ranges(blackout_ranges)
 
     week_events = instructional_week_events(first_day, last_day, blackout_ranges)
 
@@ -721,8 +850,13 @@ def main():
         return
 
     service = get_calendar_service(args.credentials, args.token)
-    for summary, s, e, desc in events_to_create:
-        upsert_event(service, args.calendar_id, summary, s, e, desc)
+
+    # One listing over the whole term (same padding the per-event search used) instead of one per event
+    time_min = _rfc3339_midnight(min(s for _, s, _, _ in events_to_create) - timedelta(days=2))
+    time_max = _rfc3339_midnight(max(e for _, _, e, _ in events_to_create) + timedelta(days=3))
+    existing = prefetch_existing(service, args.calendar_id, time_min, time_max)
+
+    upsert_events(service, args.calendar_id, existing, events_to_create)
 
     print("\nDone.")
 